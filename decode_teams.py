@@ -7,6 +7,7 @@ Decodes team/player data from ROM into JSON format.
 
 import sys
 import json
+import mmap
 import argparse
 
 from sslib import decode_rom
@@ -20,7 +21,7 @@ def main():
     args = parser.parse_args()
 
     with open(args.rom, 'rb') as f:
-        rom = f.read()
+        rom = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
     teams = decode_rom(rom)
 
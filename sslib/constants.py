@@ -37,7 +37,8 @@ POSITION_NAMES = {
 }
 POSITION_VALUES = {v: k for k, v in POSITION_NAMES.items()}
 
-KNOWN_COUNTRIES = {
+# Compiled into the auto_find_teams country scan at import, so kept immutable
+KNOWN_COUNTRIES = frozenset({
     "ENGLAND", "SCOTLAND", "WALES", "NORTHERN IRELAND", "REPUBLIC OF IRELAND",
     "FRANCE", "GERMANY", "ITALY", "SPAIN", "HOLLAND", "BELGIUM", "PORTUGAL",
     "AUSTRIA", "SWITZERLAND", "SWEDEN", "NORWAY", "DENMARK", "FINLAND",
@@ -45,4 +46,4 @@ KNOWN_COUNTRIES = {
     "CZECHOSLOVAKIA", "CROATIA", "SLOVENIA", "RUSSIA", "UKRAINE",
     "ALBANIA", "CYPRUS", "ICELAND", "ISRAEL", "LUXEMBOURG", "MALTA",
     "ESTONIA", "LATVIA", "LITHUANIA", "FAEROE ISLES",
-}
+})
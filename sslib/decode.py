@@ -1,5 +1,7 @@
 """ROM reading: find pointer table, chain-walk regions, decode team blocks."""
 
+import base64
+import re
 import struct
 
 from .constants import (
@@ -8,31 +10,84 @@ from .constants import (
 )
 from .encode import encode_5bit_string, pack_5bit_values
 
+_U16 = struct.Struct('>H')
+_U32 = struct.Struct('>I')
+_POINTER_TABLE = struct.Struct('>6I')
+
+# Base32 digits are 5-bit groups read MSB-first, exactly like the game's text
+# codes, so base64.b32encode splits a byte string into its code stream in bulk.
+_B32_DIGITS = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ234567'
+_B32_TO_CHAR = bytes.maketrans(_B32_DIGITS[:len(CHARSET)], CHARSET.encode('ascii'))
+_B32_NULL = _B32_DIGITS[0]
+_B32_INVALID = _B32_DIGITS[len(CHARSET)]
+
+# Bytes past a scan offset that four 32-code strings can reach
+_TEAM_HEAD_BYTES = 4 * 32 * 5 // 8
+
+# A known country as a null-delimited lane field. Team names are found by
+# looking just before these, since countries are rare in the scan window.
+_COUNTRY_FIELD = re.compile(b'A(?:' + b'|'.join(sorted(
+    bytes(_B32_DIGITS[CHARSET.index(c)] for c in country)
+    for country in KNOWN_COUNTRIES
+)) + b')(?=A)')
+
 
 def decode_5bit_string(data, byte_offset, bit_start=0):
     """Decode a single 5-bit packed null-terminated string.
     Returns (decoded_string, next_bit_position)."""
     result = []
     bit_pos = bit_start
+    abs_bit = byte_offset * 8 + bit_start
+    byte_limit = len(data) - 2
+    charset_len = len(CHARSET)
     while True:
-        abs_bit = byte_offset * 8 + bit_pos
-        byte_idx = abs_bit // 8
-        bit_idx = abs_bit % 8
-        if byte_idx + 2 >= len(data):
+        byte_idx = abs_bit >> 3
+        if byte_idx >= byte_limit:
             break
-        val24 = (data[byte_idx] << 16) | (data[byte_idx + 1] << 8) | data[byte_idx + 2]
-        char_val = (val24 >> (24 - bit_idx - 5)) & 0x1F
+        # A 5-bit code starting at bit 0-7 always fits in two bytes
+        val16 = (data[byte_idx] << 8) | data[byte_idx + 1]
+        char_val = (val16 >> (11 - (abs_bit & 7))) & 0x1F
         if char_val == 0:
             return ''.join(result), bit_pos + 5
-        if char_val >= len(CHARSET):
+        if char_val >= charset_len:
             break
         result.append(CHARSET[char_val])
         bit_pos += 5
+        abs_bit += 5
         if len(result) > 30:
             break
     return ''.join(result), bit_pos
 
 
+def _code_lanes(data, start, end):
+    """Bulk-extract the 5-bit code streams of data[start:end].
+
+    Five bytes hold exactly eight codes, so lane r (the codes of data[start + r:])
+    has the string starting at byte start + r + 5 * j at code index 8 * j.
+    Lanes stop where decode_5bit_string stops reading, before the last two
+    bytes of data.
+    """
+    lanes = []
+    for r in range(5):
+        lane_start = start + r
+        n_codes = min(8 * (end - lane_start) // 5, (8 * (len(data) - 2 - lane_start) + 4) // 5)
+        lanes.append(base64.b32encode(data[lane_start:end])[:max(n_codes, 0)])
+    return lanes
+
+
+def _lane_string(lane, pos):
+    """Decode a string from a code lane the same way decode_5bit_string does.
+    Returns (decoded_string, next_code_index)."""
+    stop = min(pos + 31, len(lane))
+    end = lane.find(_B32_NULL, pos, stop)
+    bad = lane.find(_B32_INVALID, pos, stop if end == -1 else end)
+    if bad != -1:
+        return lane[pos:bad].translate(_B32_TO_CHAR).decode('ascii'), bad
+    if end != -1:
+        return lane[pos:end].translate(_B32_TO_CHAR).decode('ascii'), end + 1
+    return lane[pos:stop].translate(_B32_TO_CHAR).decode('ascii'), stop
+
+
 def decode_player_attrs(rom, block_offset):
     """Decode the 16 player attribute records from the attribute block.
 
@@ -41,10 +96,9 @@ def decode_player_attrs(rom, block_offset):
     """
     players = []
     base = block_offset + 22
-    for i in range(16):
-        rec_off = base + i * 8 + 2  # skip 2-byte packed text position
-        pos_byte = rom[rec_off]
-        app_byte = rom[rec_off + 1]
+    records = rom[base:base + 16 * 8]
+    # Bytes 2 and 3 of each record, after the 2-byte packed text position
+    for pos_byte, app_byte in zip(records[2::8], records[3::8]):
         pos_slot = (pos_byte >> 4) & 0x0F
         role_val = (app_byte >> 2) & 0x03
         head_val = app_byte & 0x03
@@ -63,27 +117,19 @@ def decode_player_attrs(rom, block_offset):
 
 def decode_kit_attrs(rom, block_offset):
     """Decode kit attributes from bytes 8-17 of the attribute block."""
+    kit = {}
     b = block_offset + 8
-    def _colour(v):
-        return COLOUR_NAMES.get(v, v)
-    def _style(v):
-        return STYLE_NAMES.get(v, v)
-    return {
-        'first': {
-            'style': _style(rom[b]),
-            'shirt1': _colour(rom[b + 1]),
-            'shirt2': _colour(rom[b + 2]),
-            'shorts': _colour(rom[b + 3]),
-            'socks': _colour(rom[b + 4]),
-        },
-        'second': {
-            'style': _style(rom[b + 5]),
-            'shirt1': _colour(rom[b + 6]),
-            'shirt2': _colour(rom[b + 7]),
-            'shorts': _colour(rom[b + 8]),
-            'socks': _colour(rom[b + 9]),
-        },
-    }
+    for prefix in ('first', 'second'):
+        style, shirt1, shirt2, shorts, socks = rom[b:b + 5]
+        kit[prefix] = {
+            'style': STYLE_NAMES.get(style, style),
+            'shirt1': COLOUR_NAMES.get(shirt1, shirt1),
+            'shirt2': COLOUR_NAMES.get(shirt2, shirt2),
+            'shorts': COLOUR_NAMES.get(shorts, shorts),
+            'socks': COLOUR_NAMES.get(socks, socks),
+        }
+        b += 5
+    return kit
 
 
 def decode_team_attrs(rom, block_offset):
@@ -123,8 +169,7 @@ def decode_team_block(rom, offset):
 
 def find_team_offset(rom, team_name):
     """Find the ROM offset of a 5-bit encoded team name."""
-    values = [CHARSET.index(c) for c in team_name.upper()]
-    packed, _ = pack_5bit_values(values)
+    packed, _ = pack_5bit_values(encode_5bit_string(team_name)[:-1])
     search_len = min(len(packed), 6)
     pos = rom.find(packed[:search_len], 0x020000, 0x030000)
     if pos == -1 and search_len > 3:
@@ -135,28 +180,37 @@ def find_team_offset(rom, team_name):
 def auto_find_teams(rom, scan_start=0x020000, scan_end=0x030000):
     """Scan the ROM for team blocks by looking for valid team+country sequences.
     Returns a list of offsets."""
+    lanes = _code_lanes(rom, scan_start, scan_end + _TEAM_HEAD_BYTES)
+    candidates = []
+    for group, lane in enumerate(lanes):
+        for m in _COUNTRY_FIELD.finditer(lane):
+            # Coach and first player follow the country whatever the name
+            # start, so one check accepts or skips every start for this hit
+            manager, pos3 = _lane_string(lane, m.end() + 1)
+            if not manager or len(manager) < 3 or len(manager) > 25:
+                continue
+            player1, pos4 = _lane_string(lane, pos3)
+            if not player1 or len(player1) < 3 or len(player1) > 25:
+                continue
+            # The team name is the 3-25 valid codes ending at the null before
+            # the country; only byte-aligned starts (code index a multiple
+            # of 8) count
+            null = m.start()
+            lo = max(null - 25, 0)
+            run_start = max(lane.rfind(_B32_NULL, lo, null), lane.rfind(_B32_INVALID, lo, null)) + 1
+            first = max(run_start, lo)
+            for start in range(first + (-first) % 8, null - 2, 8):
+                offset = scan_start + group + start // 8 * 5
+                text_end_byte = offset + ((pos4 - start) * 5 + 7) // 8
+                candidates.append((offset, text_end_byte))
+    candidates.sort()
     found = []
-    offset = scan_start
-    while offset < scan_end:
-        name, bits1 = decode_5bit_string(rom, offset)
-        if not name or len(name) < 3 or len(name) > 25:
-            offset += 1
-            continue
-        country, bits2 = decode_5bit_string(rom, offset, bits1)
-        if country not in KNOWN_COUNTRIES:
-            offset += 1
-            continue
-        manager, bits3 = decode_5bit_string(rom, offset, bits2)
-        if not manager or len(manager) < 3 or len(manager) > 25:
-            offset += 1
-            continue
-        player1, bits4 = decode_5bit_string(rom, offset, bits3)
-        if not player1 or len(player1) < 3 or len(player1) > 25:
-            offset += 1
+    next_offset = scan_start
+    for offset, text_end_byte in candidates:
+        if offset < next_offset or offset >= scan_end:
             continue
         found.append(offset)
-        text_end_byte = offset + (bits4 + 7) // 8
-        offset = text_end_byte + 100
+        next_offset = text_end_byte + 100
     return found
 
 
@@ -170,21 +224,24 @@ def find_pointer_table(rom):
     if not text_offsets:
         raise RuntimeError("No teams found in ROM")
 
-    for text_off in text_offsets:
-        block_start = text_off - 150
-        target = struct.pack('>I', block_start)
-        pos = 0
-        while pos < 0x30000:
-            found = rom.find(target, pos, 0x30000)
-            if found == -1:
-                break
+    # Locate every candidate block start in the code area in a single pass;
+    # the lookahead keeps overlapping hits. Candidates are then tried in the
+    # same order as before: by text offset, then ROM position, then slot.
+    targets = [_U32.pack(text_off - 150) for text_off in text_offsets]
+    pattern = re.compile(b'(?=(' + b'|'.join(re.escape(t) for t in sorted(set(targets))) + b'))')
+    hits = {}
+    for m in pattern.finditer(rom, 0, 0x30000):
+        hits.setdefault(m.group(1), []).append(m.start())
+
+    for target in targets:
+        for found in hits.get(target, ()):
             for slot in range(3):
                 table_base = found - slot * 4
                 if table_base < 0:
                     continue
                 if table_base + 24 > len(rom):
                     continue
-                ptrs = struct.unpack_from('>6I', rom, table_base)
+                ptrs = _POINTER_TABLE.unpack_from(rom, table_base)
                 nat_s, club_s, cust_s, nat_e, club_e, cust_e = ptrs
                 if (nat_s < club_s < cust_s and
                         nat_s < nat_e <= club_s and
@@ -196,7 +253,6 @@ def find_pointer_table(rom):
                         'nat_end': nat_e, 'club_end': club_e, 'cust_end': cust_e,
                         'table_base': table_base,
                     }
-            pos = found + 1
 
     raise RuntimeError("Could not find pointer table in ROM code area")
 
@@ -209,7 +265,7 @@ def chain_walk_region(rom, region_start, region_end):
     blocks = []
     pos = region_start
     while pos < region_end:
-        sz = struct.unpack_from('>H', rom, pos)[0]
+        sz = _U16.unpack_from(rom, pos)[0]
         if sz < 160 or sz > 500:
             raise RuntimeError(f"Bad block size {sz} at 0x{pos:06X}")
         blocks.append(pos)
@@ -257,19 +313,9 @@ def decode_rom(rom_bytes):
     for cat_name in ('national', 'club', 'custom'):
         output[cat_name] = []
         for t in all_teams[cat_name]:
-            players = []
-            for j, name in enumerate(t['players']):
-                pa = t['player_attrs'][j]
-                pd = {
-                    'name': name,
-                    'number': pa['number'],
-                    'position': pa['position'],
-                    'role': pa['role'],
-                    'head': pa['head'],
-                }
-                if pa.get('star'):
-                    pd['star'] = True
-                players.append(pd)
+            # player_attrs dicts already hold number/position/role/head[/star]
+            players = [{'name': name, **pa}
+                       for name, pa in zip(t['players'], t['player_attrs'])]
             ta = t['team_attrs']
             output[cat_name].append({
                 'team': t['team'],
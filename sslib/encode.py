@@ -2,14 +2,20 @@
 
 from .constants import CHARSET, ATTR_SIZE
 
+# CHARSET index for each byte value; 0xFF marks characters the game can't show
+_CHAR_TO_VALUE = bytes(CHARSET.find(chr(b)) & 0xFF for b in range(256))
+_VALUE_TO_DIGIT = bytes.maketrans(bytes(range(32)), b'0123456789abcdefghijklmnopqrstuv')
+
 
 def encode_5bit_string(text):
     """Encode a string as a 5-bit packed bitstream (with null terminator).
     Returns list of 5-bit values including the trailing 0."""
-    values = []
-    for c in text.upper():
-        idx = CHARSET.index(c)
-        values.append(idx)
+    upper = text.upper()
+    encoded = upper.encode('latin-1', 'replace').translate(_CHAR_TO_VALUE)
+    if 0xFF in encoded:
+        bad = next(c for c in upper if c not in CHARSET)
+        raise ValueError(f"character {bad!r} is not in the game's character set")
+    values = list(encoded)
     values.append(0)  # null terminator
     return values
 
@@ -17,19 +23,14 @@ def encode_5bit_string(text):
 def pack_5bit_values(values):
     """Pack a list of 5-bit values into bytes.
     Returns (bytes, total_bits)."""
-    bitstream = 0
-    nbits = 0
-    result = []
-    for val in values:
-        bitstream = (bitstream << 5) | (val & 0x1F)
-        nbits += 5
-        while nbits >= 8:
-            nbits -= 8
-            result.append((bitstream >> nbits) & 0xFF)
     total_bits = len(values) * 5
-    if nbits > 0:
-        result.append((bitstream << (8 - nbits)) & 0xFF)
-    return bytes(result), total_bits
+    if not values:
+        return b'', total_bits
+    # Each value is one base-32 digit, so int() builds the whole bitstream at once
+    digits = bytes([val & 0x1F for val in values]).translate(_VALUE_TO_DIGIT)
+    bitstream = int(digits, 32)
+    nbytes = (total_bits + 7) // 8
+    return (bitstream << (nbytes * 8 - total_bits)).to_bytes(nbytes, 'big'), total_bits
 
 
 def encode_team_text(team):
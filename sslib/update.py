@@ -9,6 +9,9 @@ from .constants import (
 from .decode import decode_team_block, find_pointer_table, chain_walk_region
 from .encode import encode_team_text, compute_packed_positions
 
+_U16 = struct.Struct('>H')
+_POINTER_TABLE = struct.Struct('>6I')
+
 
 def _resolve_colour(val):
     if isinstance(val, str):
@@ -100,8 +103,8 @@ def build_region(rom, block_offsets, teams_json):
         positions = compute_packed_positions(text_bytes)
 
         attrs = bytearray(attr_blocks[i])
-        for str_idx, attr_off in enumerate(ATTR_OFFSETS):
-            struct.pack_into('>H', attrs, attr_off, positions[str_idx])
+        for attr_off, position in zip(ATTR_OFFSETS, positions):
+            _U16.pack_into(attrs, attr_off, position)
 
         if 'kit' in team:
             apply_kit_attrs(attrs, team['kit'])
@@ -109,7 +112,7 @@ def build_region(rom, block_offsets, teams_json):
         apply_player_attrs(attrs, team['players'])
 
         block_size = ATTR_SIZE + len(text_bytes) + (len(text_bytes) % 2)
-        struct.pack_into('>H', attrs, 0, block_size)
+        _U16.pack_into(attrs, 0, block_size)
 
         new_region.extend(attrs)
         new_region.extend(text_bytes)
@@ -163,7 +166,7 @@ def update_rom(rom_bytes, teams_json):
     max_end = cust_end
     scan_pos = cust_end
     while scan_pos < len(rom) - 1:
-        word = struct.unpack_from('>H', rom, scan_pos)[0]
+        word = _U16.unpack_from(rom, scan_pos)[0]
         if word != 0:
             max_end = scan_pos
             break
@@ -201,12 +204,8 @@ def update_rom(rom_bytes, teams_json):
         rom[nat_start + len(combined):nat_start + old_total] = b'\x00' * (old_total - len(combined))
 
     # Update all 6 pointers
-    tb = ptrs['table_base']
-    struct.pack_into('>I', rom, tb + 0, new_nat_start)
-    struct.pack_into('>I', rom, tb + 4, new_club_start)
-    struct.pack_into('>I', rom, tb + 8, new_cust_start)
-    struct.pack_into('>I', rom, tb + 12, new_nat_end)
-    struct.pack_into('>I', rom, tb + 16, new_club_end)
-    struct.pack_into('>I', rom, tb + 20, new_cust_end)
+    _POINTER_TABLE.pack_into(rom, ptrs['table_base'],
+                             new_nat_start, new_club_start, new_cust_start,
+                             new_nat_end, new_club_end, new_cust_end)
 
     return bytes(rom)
@@ -8,6 +8,7 @@ into the ROM.
 
 import sys
 import json
+import mmap
 import argparse
 
 from sslib import validate_teams, update_rom
@@ -31,7 +32,7 @@ def main():
         sys.exit(1)
 
     with open(args.rom, 'rb') as f:
-        rom = f.read()
+        rom = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
     with open(args.teams_json, 'r') as f:
         teams_json = json.load(f)